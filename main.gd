@@ -58,7 +58,7 @@ func _setup_material() -> void:
 	# Use procedural atlas (external atlas.png not required)
 	# To use an external texture, create textures/atlas.png and uncomment:
 	# var texture = load("res://textures/atlas.png")
-	var texture = _create_procedural_atlas()
+	var texture = BlockAtlas.create_texture()
 	
 	block_material.albedo_texture = texture
 	
@@ -68,75 +68,6 @@ func _setup_material() -> void:
 	block_material.metallic = 0.0
 	block_material.cull_mode = BaseMaterial3D.CULL_DISABLED  # Show both sides of faces
 
-# Create a procedural texture atlas (for testing without external textures)
-func _create_procedural_atlas() -> ImageTexture:
-	var atlas_size := 64  # 2x2 grid of 32x32 textures
-	var tile_size := 32
-	
-	var image := Image.create(atlas_size, atlas_size, false, Image.FORMAT_RGBA8)
-	
-	# Grass Top (0, 0) - Green
-	_fill_tile(image, 0, 0, tile_size, Color(0.2, 0.7, 0.2))
-	
-	# Grass Side (1, 0) - Green top, brown bottom
-	_fill_tile_gradient(image, tile_size, 0, tile_size, 
-		Color(0.2, 0.7, 0.2), Color(0.55, 0.35, 0.2))
-	
-	# Dirt (0, 1) - Brown
-	_fill_tile(image, 0, tile_size, tile_size, Color(0.55, 0.35, 0.2))
-	
-	# Stone (1, 1) - Gray with variation
-	_fill_tile_stone(image, tile_size, tile_size, tile_size)
-	
-	var texture := ImageTexture.create_from_image(image)
-	return texture
-
-# Fill a tile with a solid color
-func _fill_tile(image: Image, x: int, y: int, size: int, color: Color) -> void:
-	for px in size:
-		for py in size:
-			# Add slight noise for texture
-			var noise := randf_range(-0.05, 0.05)
-			var c := Color(
-				clamp(color.r + noise, 0, 1),
-				clamp(color.g + noise, 0, 1),
-				clamp(color.b + noise, 0, 1),
-				1.0
-			)
-			image.set_pixel(x + px, y + py, c)
-
-# Fill a tile with vertical gradient (for grass side)
-func _fill_tile_gradient(image: Image, x: int, y: int, size: int, 
-	top_color: Color, bottom_color: Color) -> void:
-	for px in size:
-		for py in size:
-			var t := float(py) / float(size)
-			# Top part is grass, bottom is dirt
-			var color: Color
-			if py < size / 4:
-				color = top_color
-			else:
-				color = bottom_color
-			
-			# Add noise
-			var noise := randf_range(-0.05, 0.05)
-			var c := Color(
-				clamp(color.r + noise, 0, 1),
-				clamp(color.g + noise, 0, 1),
-				clamp(color.b + noise, 0, 1),
-				1.0
-			)
-			image.set_pixel(x + px, y + py, c)
-
-# Fill a tile with stone texture (gray with variation)
-func _fill_tile_stone(image: Image, x: int, y: int, size: int) -> void:
-	for px in size:
-		for py in size:
-			var base_gray := 0.5
-			var noise := randf_range(-0.15, 0.15)
-			var gray: float = clamp(base_gray + noise, 0.3, 0.7)
-			image.set_pixel(x + px, y + py, Color(gray, gray, gray, 1.0))
-
 # Initialize world systems
 func _setup_world() -> void:
 	# Configure world generator
@@ -32,8 +32,10 @@ func _process(_delta: float) -> void:
 	if chunk_manager == null:
 		return
 	
-	_update_highlight()
-	_handle_input()
+	# One raycast per frame, shared by the highlight and click handling
+	var result := _raycast_from_camera()
+	_update_highlight(result)
+	_handle_input(result)
 
 # Create a wireframe cube to highlight the targeted block
 func _create_highlight_mesh() -> void:
@@ -54,18 +56,19 @@ func _create_highlight_mesh() -> void:
 	highlight_mesh.visible = false
 	add_child(highlight_mesh)
 
-# Update the highlight cube position
-func _update_highlight() -> void:
+# Cast a ray from the camera to find the targeted block
+func _raycast_from_camera() -> Dictionary:
 	var camera := player.get_camera()
 	if camera == null:
-		highlight_mesh.visible = false
-		return
+		return {"hit": false}
 	
 	var ray_origin := camera.get_camera_position()
 	var ray_dir := camera.get_look_direction()
 	
-	var result := chunk_manager.raycast_block(ray_origin, ray_dir, reach_distance)
-	
+	return chunk_manager.raycast_block(ray_origin, ray_dir, reach_distance)
+
+# Update the highlight cube position
+func _update_highlight(result: Dictionary) -> void:
 	if result.hit:
 		highlight_mesh.visible = true
 		highlight_mesh.global_position = Vector3(result.position) + Vector3(0.5, 0.5, 0.5)
@@ -73,19 +76,11 @@ func _update_highlight() -> void:
 		highlight_mesh.visible = false
 
 # Handle mouse click input for block interaction
-func _handle_input() -> void:
-	var camera := player.get_camera()
-	if camera == null:
-		return
-	
+func _handle_input(result: Dictionary) -> void:
 	# Only process when mouse is captured
 	if Input.mouse_mode != Input.MOUSE_MODE_CAPTURED:
 		return
 	
-	var ray_origin := camera.get_camera_position()
-	var ray_dir := camera.get_look_direction()
-	var result := chunk_manager.raycast_block(ray_origin, ray_dir, reach_distance)
-	
 	if not result.hit:
 		return
 	
@@ -103,12 +98,10 @@ func _break_block(block_pos: Vector3i) -> void:
 
 # Place a block at the given position
 func _place_block(block_pos: Vector3i) -> void:
-	# Don't place block if it would be inside the player
-	var player_pos := Vector3i(player.global_position)
-	var player_feet := player_pos
-	var player_head := player_pos + Vector3i(0, 1, 0)
-	
-	if block_pos == player_feet or block_pos == player_head:
+	# Don't place block if it would overlap the player's collision bounds
+	# (shrunk slightly so standing on or against a block face doesn't count)
+	var block_aabb := AABB(Vector3(block_pos), Vector3.ONE)
+	if block_aabb.intersects(player.get_collision_aabb().grow(-0.01)):
 		return
 	
 	chunk_manager.set_block_at_world(block_pos, current_block_type)
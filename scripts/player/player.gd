@@ -28,6 +28,14 @@ var available_blocks: Array[Block.Type] = [Block.Type.DIRT, Block.Type.GRASS, Bl
 # Current movement state
 var current_speed: float = 5.0
 
+# Bounds of the collision capsule relative to the body origin (read in _ready)
+var collision_bounds: AABB = AABB()
+
+# sin/cos of the yaw used for movement, recomputed only when the yaw changes
+var cached_yaw: float = NAN
+var yaw_sin: float = 0.0
+var yaw_cos: float = 1.0
+
 # Whether physics is frozen (waiting for world to load)
 var is_frozen: bool = true
 
@@ -38,6 +46,16 @@ func _ready() -> void:
 	# Block interaction component
 	block_interaction = $BlockInteraction as BlockInteraction
 	
+	# Collision bounds from the capsule shape and its offset in the scene
+	var collision := $CollisionShape3D as CollisionShape3D
+	var capsule := collision.shape as CapsuleShape3D
+	var radius := capsule.radius
+	var height := capsule.height
+	collision_bounds = collision.transform * AABB(
+		Vector3(-radius, -height / 2, -radius),
+		Vector3(radius * 2, height, radius * 2)
+	)
+	
 	# Initial block selection
 	_select_block(0)
 	
@@ -49,11 +67,12 @@ func _unhandled_input(event: InputEvent) -> void:
 	if is_frozen:
 		return
 	
-	# Numeric key selection (1-3)
+	# Numeric key selection (1-9, one key per available block)
 	if event is InputEventKey and event.pressed:
-		if event.keycode == KEY_1: _select_block(0)
-		elif event.keycode == KEY_2: _select_block(1)
-		elif event.keycode == KEY_3: _select_block(2)
+		if event.keycode >= KEY_1 and event.keycode <= KEY_9:
+			var slot: int = event.keycode - KEY_1
+			if slot < available_blocks.size():
+				_select_block(slot)
 	
 	# Mouse wheel scroll
 	if event is InputEventMouseButton and event.pressed:
@@ -64,7 +83,7 @@ func _unhandled_input(event: InputEvent) -> void:
 
 func _select_block(index: int) -> void:
 	selected_block_index = index
-	var block_type = available_blocks[index]
+	var block_type: Block.Type = available_blocks[index]
 	
 	if block_interaction:
 		block_interaction.set_current_block(block_type)
@@ -97,21 +116,27 @@ func _handle_jump() -> void:
 
 # Handle WASD movement
 func _handle_movement() -> void:
-	# Get input direction
-	var input_dir := Vector2.ZERO
-	input_dir.x = Input.get_axis("move_left", "move_right")
-	input_dir.y = Input.get_axis("move_forward", "move_backward")
+	# Get input direction (one action-map query for all four movement actions)
+	var input_dir := Input.get_vector("move_left", "move_right", "move_forward", "move_backward")
 	
-	# Convert to 3D direction relative to camera's horizontal facing
+	# Convert to 3D direction relative to the horizontal facing
 	var direction := Vector3.ZERO
-	if camera and input_dir != Vector2.ZERO:
-		# Get camera's forward direction (ignoring pitch)
-		var cam_basis := camera.global_transform.basis
-		var forward := -Vector3(cam_basis.z.x, 0, cam_basis.z.z).normalized()
-		var right := Vector3(cam_basis.x.x, 0, cam_basis.x.z).normalized()
-		
-		direction = right * input_dir.x + forward * (-input_dir.y)
-		direction = direction.normalized()
+	if input_dir != Vector2.ZERO:
+		# Yaw lives on the player body (pitch is camera-only), so rotating the
+		# input by rotation.y gives the flattened camera basis directly:
+		# right = (cos, 0, -sin), forward = (-sin, 0, -cos)
+		var yaw := rotation.y
+		if yaw != cached_yaw:
+			cached_yaw = yaw
+			yaw_sin = sin(yaw)
+			yaw_cos = cos(yaw)
+		var s := yaw_sin
+		var c := yaw_cos
+		direction = Vector3(
+			c * input_dir.x + s * input_dir.y,
+			0,
+			-s * input_dir.x + c * input_dir.y
+		).normalized()
 	
 	# Apply movement
 	if direction != Vector3.ZERO:
@@ -122,6 +147,10 @@ func _handle_movement() -> void:
 		velocity.x = move_toward(velocity.x, 0, current_speed)
 		velocity.z = move_toward(velocity.z, 0, current_speed)
 
+# Axis-aligned bounds of the collision capsule in world space
+func get_collision_aabb() -> AABB:
+	return AABB(global_position + collision_bounds.position, collision_bounds.size)
+
 # Get camera for external access
 func get_camera() -> PlayerCamera:
 	return camera
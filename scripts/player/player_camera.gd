@@ -36,6 +36,11 @@ func _input(event: InputEvent) -> void:
 
 # Process mouse movement for camera rotation
 func _handle_mouse_look(mouse_delta: Vector2) -> void:
+	# Motion events with no relative movement (e.g. after capture/warp) would
+	# only dirty both transforms for nothing
+	if mouse_delta == Vector2.ZERO:
+		return
+	
 	# Horizontal rotation (yaw) - rotate the player body
 	if player:
 		player.rotate_y(-mouse_delta.x * mouse_sensitivity)
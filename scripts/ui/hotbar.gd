@@ -14,15 +14,11 @@ const COLOR_NORMAL := Color(0.2, 0.2, 0.2, 0.6)
 
 # UI Elements
 var slots_container: HBoxContainer = null
-var slot_panels: Array[PanelContainer] = []
+var slot_styles: Array[StyleBoxFlat] = []  # Panel style of each slot
 var active_index: int = 0
 
-# Block names mapping
-const BLOCK_NAMES = {
-	Block.Type.DIRT: "Dirt",
-	Block.Type.GRASS: "Grass",
-	Block.Type.STONE: "Stone"
-}
+# Display names of the hotbar slots, in Player.available_blocks order
+const SLOT_NAMES: Array[String] = ["Dirt", "Grass", "Stone"]
 
 func _ready() -> void:
 	# Make this control fill the screen so children can anchor properly
@@ -41,10 +37,7 @@ func _create_ui() -> void:
 	
 	var style := StyleBoxFlat.new()
 	style.bg_color = COLOR_BG
-	style.corner_radius_top_left = 10
-	style.corner_radius_top_right = 10
-	style.corner_radius_bottom_left = 10
-	style.corner_radius_bottom_right = 10
+	style.set_corner_radius_all(10)
 	style.content_margin_left = 10
 	style.content_margin_right = 10
 	style.content_margin_top = 5
@@ -59,26 +52,19 @@ func _create_ui() -> void:
 	panel.add_child(slots_container)
 	
 	# Create slots for available blocks
-	var blocks = [Block.Type.DIRT, Block.Type.GRASS, Block.Type.STONE]
-	for i in range(blocks.size()):
-		_create_slot(blocks[i], i)
+	for i in range(SLOT_NAMES.size()):
+		_create_slot(i)
 	
 	update_selection(0)
 
-func _create_slot(block_type: Block.Type, index: int) -> void:
+func _create_slot(index: int) -> void:
 	var slot := PanelContainer.new()
 	slot.custom_minimum_size = Vector2(60, 60)
 	
 	var style := StyleBoxFlat.new()
 	style.bg_color = COLOR_NORMAL
-	style.corner_radius_top_left = 5
-	style.corner_radius_top_right = 5
-	style.corner_radius_bottom_left = 5
-	style.corner_radius_bottom_right = 5
-	style.border_width_left = 2
-	style.border_width_top = 2
-	style.border_width_right = 2
-	style.border_width_bottom = 2
+	style.set_corner_radius_all(5)
+	style.set_border_width_all(2)
 	style.border_color = Color(1, 1, 1, 0.2)
 	slot.add_theme_stylebox_override("panel", style)
 	
@@ -87,7 +73,7 @@ func _create_slot(block_type: Block.Type, index: int) -> void:
 	slot.add_child(vbox)
 	
 	var label := Label.new()
-	label.text = BLOCK_NAMES.get(block_type, "???")
+	label.text = SLOT_NAMES[index]
 	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
 	label.add_theme_font_size_override("font_size", 12)
 	vbox.add_child(label)
@@ -101,16 +87,23 @@ func _create_slot(block_type: Block.Type, index: int) -> void:
 	slot.add_child(shortcut)
 	
 	slots_container.add_child(slot)
-	slot_panels.append(slot)
+	slot_styles.append(style)
 
 # Update visual selection
+# Only the previously active slot and the new one change, so restyle just those two
 func update_selection(index: int) -> void:
+	_set_slot_highlight(active_index, false)
 	active_index = index
-	for i in range(slot_panels.size()):
-		var style := slot_panels[i].get_theme_stylebox("panel") as StyleBoxFlat
-		if i == index:
-			style.bg_color = Color(0.4, 0.4, 0.6, 0.8)
-			style.border_color = Color(1, 1, 1, 1)
-		else:
-			style.bg_color = COLOR_NORMAL
-			style.border_color = Color(1, 1, 1, 0.2)
+	_set_slot_highlight(index, true)
+
+func _set_slot_highlight(index: int, selected: bool) -> void:
+	if index < 0 or index >= slot_styles.size():
+		return
+	
+	var style := slot_styles[index]
+	if selected:
+		style.bg_color = Color(0.4, 0.4, 0.6, 0.8)
+		style.border_color = Color(1, 1, 1, 1)
+	else:
+		style.bg_color = COLOR_NORMAL
+		style.border_color = Color(1, 1, 1, 0.2)
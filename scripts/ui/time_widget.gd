@@ -15,6 +15,7 @@ var day_night_cycle: DayNightCycle = null
 var time_label: Label = null
 var status_label: Label = null
 var progress_bar: ProgressBar = null
+var progress_fill_style: StyleBoxFlat = null  # Recolored when day/night flips
 
 func _ready() -> void:
 	_create_ui()
@@ -28,10 +29,7 @@ func _create_ui() -> void:
 	# Make panel semi-transparent
 	var style := StyleBoxFlat.new()
 	style.bg_color = Color(0, 0, 0, 0.6)
-	style.corner_radius_top_left = 8
-	style.corner_radius_top_right = 8
-	style.corner_radius_bottom_left = 8
-	style.corner_radius_bottom_right = 8
+	style.set_corner_radius_all(8)
 	style.content_margin_left = 10
 	style.content_margin_right = 10
 	style.content_margin_top = 8
@@ -45,18 +43,10 @@ func _create_ui() -> void:
 	panel.add_child(vbox)
 	
 	# Status label (Day/Night indicator)
-	status_label = Label.new()
-	status_label.text = "Day 1"
-	status_label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
-	status_label.add_theme_font_size_override("font_size", 14)
-	vbox.add_child(status_label)
+	status_label = _create_label(vbox, "Day 1", 14)
 	
 	# Time label
-	time_label = Label.new()
-	time_label.text = "06:00"
-	time_label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
-	time_label.add_theme_font_size_override("font_size", 20)
-	vbox.add_child(time_label)
+	time_label = _create_label(vbox, "06:00", 20)
 	
 	# Progress bar
 	progress_bar = ProgressBar.new()
@@ -65,8 +55,21 @@ func _create_ui() -> void:
 	progress_bar.value = 0.0
 	progress_bar.show_percentage = false
 	progress_bar.custom_minimum_size = Vector2(130, 8)
+	
+	progress_fill_style = StyleBoxFlat.new()
+	progress_fill_style.set_corner_radius_all(4)
+	progress_bar.add_theme_stylebox_override("fill", progress_fill_style)
 	vbox.add_child(progress_bar)
 
+# Create a centered label with the given font size and add it to parent
+func _create_label(parent: Control, text: String, font_size: int) -> Label:
+	var label := Label.new()
+	label.text = text
+	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
+	label.add_theme_font_size_override("font_size", font_size)
+	parent.add_child(label)
+	return label
+
 func setup(cycle: DayNightCycle) -> void:
 	day_night_cycle = cycle
 	if day_night_cycle:
@@ -96,13 +99,7 @@ func _update_display() -> void:
 	progress_bar.value = progress
 	
 	# Color the progress bar based on time
-	var bar_style := StyleBoxFlat.new()
-	if is_day:
-		bar_style.bg_color = Color(1.0, 0.8, 0.2)  # Golden/yellow
-	else:
-		bar_style.bg_color = Color(0.3, 0.3, 0.7)  # Dark blue
-	bar_style.corner_radius_top_left = 4
-	bar_style.corner_radius_top_right = 4
-	bar_style.corner_radius_bottom_left = 4
-	bar_style.corner_radius_bottom_right = 4
-	progress_bar.add_theme_stylebox_override("fill", bar_style)
+	# Golden/yellow by day, dark blue at night
+	var fill_color: Color = Color(1.0, 0.8, 0.2) if is_day else Color(0.3, 0.3, 0.7)
+	if progress_fill_style.bg_color != fill_color:
+		progress_fill_style.bg_color = fill_color
@@ -82,6 +82,25 @@ static func get_uv(block_type: Type, face: Face) -> Rect2:
 		UV_SIZE
 	)
 
+# Get the 4 atlas UVs of a face quad, matching QUAD_UVS vertex order
+static func get_face_uvs(block_type: Type, face: Face) -> PackedVector2Array:
+	return _face_uv_table[block_type][face]
+
+# Build the [block_type][face] -> PackedVector2Array UV table
+# (Type and Face values are contiguous from 0, so they index the arrays directly)
+static func _build_face_uv_table() -> Array:
+	var table := []
+	for block_type in Type.values():
+		var face_uvs := []
+		for face in Face.values():
+			var uv_rect := get_uv(block_type, face)
+			var uvs := PackedVector2Array()
+			for quad_uv in QUAD_UVS:
+				uvs.append(uv_rect.position + quad_uv * uv_rect.size)
+			face_uvs.append(uvs)
+		table.append(face_uvs)
+	return table
+
 # Check if a block type is solid (for face culling)
 static func is_solid(block_type: Type) -> bool:
 	return block_type != Type.AIR
@@ -118,6 +137,9 @@ const QUAD_UVS: Array[Vector2] = [
 	Vector2(0, 1), Vector2(1, 1), Vector2(1, 0), Vector2(0, 0)
 ]
 
+# Precomputed atlas UVs per block type and face (see get_face_uvs)
+static var _face_uv_table: Array = _build_face_uv_table()
+
 # Triangle indices for a quad (two triangles) - reversed for correct outward normals
 const QUAD_INDICES: Array[int] = [0, 2, 1, 0, 3, 2]
 
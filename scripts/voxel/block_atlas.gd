@@ -0,0 +1,110 @@
+# ==============================================================================
+# Block Atlas - Procedural Texture Atlas
+# ==============================================================================
+# Generates the block texture atlas in code, so no external image is needed.
+# Tiles follow the grid positions in Block (TEX_GRASS_TOP, TEX_DIRT, ...):
+#
+# +-------------+-------------+
+# | Grass Top   | Grass Side  |
+# +-------------+-------------+
+# | Dirt        | Stone       |
+# +-------------+-------------+
+#
+# All tiles are written into one RGBA8 buffer and turned into an Image once.
+# ==============================================================================
+
+class_name BlockAtlas
+extends RefCounted
+
+const TILE_SIZE := 32  # Pixels per tile side
+const ATLAS_SIZE := TILE_SIZE * Block.ATLAS_SIZE  # Pixels per atlas side
+
+# Base tile colors
+const GRASS_COLOR := Color(0.2, 0.7, 0.2)
+const DIRT_COLOR := Color(0.55, 0.35, 0.2)
+
+# Alpha byte of an RGBA8 pixel packed into a little-endian u32
+const OPAQUE_ALPHA := 0xFF000000
+
+# Create the block atlas texture
+static func create_texture() -> ImageTexture:
+	return ImageTexture.create_from_image(create_image())
+
+# Create the block atlas image
+static func create_image() -> Image:
+	# One RGBA8 buffer for the whole atlas; each builder writes its tile in place
+	var data := PackedByteArray()
+	data.resize(ATLAS_SIZE * ATLAS_SIZE * 4)
+	
+	# Grass Top - Green
+	_make_tile(data, Vector2i(Block.TEX_GRASS_TOP), GRASS_COLOR, 0)
+	# Grass Side - Green top, brown bottom
+	_make_tile_gradient(data, Vector2i(Block.TEX_GRASS_SIDE), GRASS_COLOR, DIRT_COLOR, 1)
+	# Dirt - Brown
+	_make_tile(data, Vector2i(Block.TEX_DIRT), DIRT_COLOR, 2)
+	# Stone - Gray with variation
+	_make_tile_stone(data, Vector2i(Block.TEX_STONE), 3)
+	
+	return Image.create_from_data(ATLAS_SIZE, ATLAS_SIZE, false, Image.FORMAT_RGBA8, data)
+
+# Byte offset of the first pixel of a tile row in the atlas buffer
+static func _row_offset(tile_pos: Vector2i, py: int) -> int:
+	return ((tile_pos.y * TILE_SIZE + py) * ATLAS_SIZE + tile_pos.x * TILE_SIZE) * 4
+
+# Build a tile with a solid color
+static func _make_tile(data: PackedByteArray, tile_pos: Vector2i, color: Color, salt: int) -> void:
+	var r: int = color.r8
+	var g: int = color.g8
+	var b: int = color.b8
+	for py: int in TILE_SIZE:
+		var offset: int = _row_offset(tile_pos, py)
+		for px: int in TILE_SIZE:
+			# Add slight noise for texture (~0.05 in 8-bit units)
+			var noise: int = _hash_noise(px, py, salt, 13)
+			data.encode_u32(offset, clampi(r + noise, 0, 255)
+				| (clampi(g + noise, 0, 255) << 8)
+				| (clampi(b + noise, 0, 255) << 16)
+				| OPAQUE_ALPHA)
+			offset += 4
+
+# Build a tile with vertical gradient (for grass side)
+static func _make_tile_gradient(data: PackedByteArray, tile_pos: Vector2i, top_color: Color, bottom_color: Color, salt: int) -> void:
+	for py: int in TILE_SIZE:
+		# Top part is grass, bottom is dirt (constant per row)
+		var color: Color = top_color if py < TILE_SIZE / 4 else bottom_color
+		var r: int = color.r8
+		var g: int = color.g8
+		var b: int = color.b8
+		var offset: int = _row_offset(tile_pos, py)
+		for px: int in TILE_SIZE:
+			# Add noise
+			var noise: int = _hash_noise(px, py, salt, 13)
+			data.encode_u32(offset, clampi(r + noise, 0, 255)
+				| (clampi(g + noise, 0, 255) << 8)
+				| (clampi(b + noise, 0, 255) << 16)
+				| OPAQUE_ALPHA)
+			offset += 4
+
+# Build a tile with stone texture (gray with variation)
+static func _make_tile_stone(data: PackedByteArray, tile_pos: Vector2i, salt: int) -> void:
+	for py: int in TILE_SIZE:
+		var offset: int = _row_offset(tile_pos, py)
+		for px: int in TILE_SIZE:
+			# 0.5 base gray, +/-0.15 noise, clamped to 0.3-0.7
+			var gray: int = clampi(128 + _hash_noise(px, py, salt, 38), 77, 179)
+			data.encode_u32(offset, gray | (gray << 8) | (gray << 16) | OPAQUE_ALPHA)
+			offset += 4
+
+# Deterministic pixel noise in [-amplitude, amplitude]
+# FNV-1a hash of (x, y, salt) - same texture every run, no RNG state per pixel
+static func _hash_noise(x: int, y: int, salt: int, amplitude: int) -> int:
+	var h: int = 2166136261
+	h = ((h ^ x) * 16777619) & 0xFFFFFFFF
+	h = ((h ^ y) * 16777619) & 0xFFFFFFFF
+	h = ((h ^ salt) * 16777619) & 0xFFFFFFFF
+	# Finalize (murmur3-style) so small neighbouring inputs don't come out
+	# as visible ramps after the modulo
+	h ^= h >> 16
+	h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+	h ^= h >> 13
+	return h % (amplitude * 2 + 1) - amplitude
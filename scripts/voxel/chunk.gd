@@ -21,7 +21,8 @@
 class_name Chunk
 extends Node3D
 
-const CHUNK_SIZE := 16  # Width, height, and depth in blocks
+const CHUNK_SHIFT := 4  # log2(CHUNK_SIZE), for floor division by shifting
+const CHUNK_SIZE := 1 << CHUNK_SHIFT  # Width, height, and depth in blocks
 
 # 3D array of block types [x][y][z]
 var blocks: Array = []
@@ -30,7 +31,7 @@ var blocks: Array = []
 var chunk_position: Vector3i = Vector3i.ZERO
 
 # Reference to chunk manager for neighbor lookups
-var chunk_manager: Node = null
+var chunk_manager: ChunkManager = null
 
 # Mesh components
 var mesh_instance: MeshInstance3D = null
@@ -57,13 +58,14 @@ func _ready() -> void:
 func _initialize_blocks() -> void:
 	blocks.resize(CHUNK_SIZE)
 	for x in CHUNK_SIZE:
-		blocks[x] = []
-		blocks[x].resize(CHUNK_SIZE)
+		var plane := []
+		plane.resize(CHUNK_SIZE)
 		for y in CHUNK_SIZE:
-			blocks[x][y] = []
-			blocks[x][y].resize(CHUNK_SIZE)
-			for z in CHUNK_SIZE:
-				blocks[x][y][z] = Block.Type.AIR
+			var row := []
+			row.resize(CHUNK_SIZE)
+			row.fill(Block.Type.AIR)
+			plane[y] = row
+		blocks[x] = plane
 
 # Setup the MeshInstance3D for rendering
 func _setup_mesh_instance() -> void:
@@ -135,13 +137,20 @@ static func world_to_local(world_pos: Vector3i, chunk_pos: Vector3i) -> Vector3i
 
 # Get chunk position from world position
 static func world_to_chunk(world_pos: Vector3i) -> Vector3i:
-	# Use floor division for correct negative coordinate handling
+	# Arithmetic right shift is floor division by CHUNK_SIZE, correct for
+	# negative coordinates too, without a float round-trip per axis
 	return Vector3i(
-		floori(float(world_pos.x) / CHUNK_SIZE),
-		floori(float(world_pos.y) / CHUNK_SIZE),
-		floori(float(world_pos.z) / CHUNK_SIZE)
+		world_pos.x >> CHUNK_SHIFT,
+		world_pos.y >> CHUNK_SHIFT,
+		world_pos.z >> CHUNK_SHIFT
 	)
 
+# Get the block (voxel) coordinates containing a continuous world position
+# Floors each axis; Vector3i(Vector3) truncates toward zero instead, which
+# picks the wrong block for negative coordinates
+static func world_to_block(world_pos: Vector3) -> Vector3i:
+	return Vector3i(floori(world_pos.x), floori(world_pos.y), floori(world_pos.z))
+
 # ==============================================================================
 # MESH GENERATION WITH FACE CULLING
 # ==============================================================================
@@ -251,23 +260,15 @@ func _add_face(
 	vertex_offset: int
 ) -> int:
 	var vertices: Array = Block.FACE_VERTICES[face]
-	var uv_rect := Block.get_uv(block_type, face)
+	var uvs := Block.get_face_uvs(block_type, face)  # Already in atlas coordinates
 	var normal: Vector3 = Block.FACE_NORMALS[face]
+	var origin := Vector3(local_pos)
 	
 	# Add the 4 vertices of the face
 	for i in 4:
-		var vertex: Vector3 = vertices[i] + Vector3(local_pos)
-		var uv: Vector2 = Block.QUAD_UVS[i]
-		
-		# Transform UV to atlas coordinates
-		uv = Vector2(
-			uv_rect.position.x + uv.x * uv_rect.size.x,
-			uv_rect.position.y + uv.y * uv_rect.size.y
-		)
-		
 		st.set_normal(normal)
-		st.set_uv(uv)
-		st.add_vertex(vertex)
+		st.set_uv(uvs[i])
+		st.add_vertex(vertices[i] + origin)
 	
 	# Add indices for the two triangles (quad)
 	for idx in Block.QUAD_INDICES:
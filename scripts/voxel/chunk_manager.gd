@@ -27,13 +27,14 @@ signal initial_chunks_ready
 var chunks: Dictionary = {}
 
 # Reference to world generator
-var world_generator: Node = null
+var world_generator: WorldGenerator = null
 
 # Player reference for distance calculations
 var player: Node3D = null
 
 # Chunk loading queue for async loading
 var load_queue: Array[Vector3i] = []
+var queued_chunks: Dictionary = {}  # Vector3i -> true, mirrors load_queue for O(1) lookups
 var chunks_per_frame: int = 1  # Max chunks per frame
 var max_load_time_ms: float = 5.0  # Time budget in milliseconds per frame
 
@@ -47,6 +48,18 @@ var dirty_chunks_per_frame: int = 1  # Limit dirty chunk rebuilds per frame
 # Initialization state
 var is_initialized: bool = false
 
+# Last chunk the player was in - load/unload only re-evaluates when this changes
+var last_player_chunk: Vector3i = Vector3i.MAX
+
+# Last chunk resolved by get_block_at_world - consecutive queries (ray steps,
+# column scans) nearly always land in the same chunk, so skip the dictionary
+var cached_chunk_pos: Vector3i = Vector3i.MAX
+var cached_chunk: Chunk = null
+
+# Frustum culling runs every Nth frame rather than every frame
+var frustum_update_interval: int = 3
+var frustum_frame_counter: int = 0
+
 func _ready() -> void:
 	# Material will be set by main.gd
 	pass
@@ -54,7 +67,7 @@ func _ready() -> void:
 # Generate initial chunks synchronously around a spawn position
 # This ensures the player has ground to stand on before spawning
 func generate_initial_chunks(spawn_pos: Vector3) -> void:
-	var spawn_chunk := Chunk.world_to_chunk(Vector3i(spawn_pos))
+	var spawn_chunk := Chunk.world_to_chunk(Chunk.world_to_block(spawn_pos))
 	var initial_radius := 2  # Smaller radius for faster initial load
 	
 	# Generate chunks in a small radius around spawn
@@ -80,7 +93,9 @@ func _process(_delta: float) -> void:
 	if chunks_loaded == 0:
 		_process_dirty_chunks()
 	
-	_update_frustum_culling()
+	frustum_frame_counter = (frustum_frame_counter + 1) % frustum_update_interval
+	if frustum_frame_counter == 0:
+		_update_frustum_culling()
 
 # Process dirty chunks (rebuild meshes for boundary updates)
 func _process_dirty_chunks() -> void:
@@ -104,7 +119,13 @@ func _process_dirty_chunks() -> void:
 
 # Update which chunks should be loaded based on player position
 func _update_loaded_chunks() -> void:
-	var player_chunk := Chunk.world_to_chunk(Vector3i(player.global_position))
+	var player_chunk := Chunk.world_to_chunk(Chunk.world_to_block(player.global_position))
+	
+	# The desired set only depends on the player's chunk, so skip the scan
+	# until the player crosses a chunk boundary (queued chunks keep loading)
+	if player_chunk == last_player_chunk:
+		return
+	last_player_chunk = player_chunk
 	
 	# Determine chunks that should be loaded
 	var desired_chunks: Dictionary = {}
@@ -116,10 +137,21 @@ func _update_loaded_chunks() -> void:
 				desired_chunks[chunk_pos] = true
 				
 				# Queue for loading if not already loaded
-				if not chunks.has(chunk_pos) and not load_queue.has(chunk_pos):
+				if not chunks.has(chunk_pos) and not queued_chunks.has(chunk_pos):
 					load_queue.append(chunk_pos)
+					queued_chunks[chunk_pos] = true
 					queue_needs_sort = true  # Mark for re-sort
 	
+	# Drop queued chunks that are no longer in range, so they aren't loaded
+	# after the player has moved away from them
+	var still_queued: Array[Vector3i] = []
+	for chunk_pos in load_queue:
+		if desired_chunks.has(chunk_pos):
+			still_queued.append(chunk_pos)
+		else:
+			queued_chunks.erase(chunk_pos)
+	load_queue = still_queued
+	
 	# Only sort if new chunks were added
 	if queue_needs_sort:
 		_sort_load_queue_by_distance(player_chunk)
@@ -161,6 +193,7 @@ func _process_load_queue() -> int:
 		if loaded_count >= chunks_per_frame:
 			break
 		var chunk_pos: Vector3i = load_queue.pop_front()
+		queued_chunks.erase(chunk_pos)
 		
 		# Skip if already loaded (might have been loaded since queued)
 		if chunks.has(chunk_pos):
@@ -180,6 +213,7 @@ func _load_chunk(chunk_pos: Vector3i) -> void:
 	
 	add_child(chunk)
 	chunks[chunk_pos] = chunk
+	_invalidate_chunk_cache(chunk_pos)
 	
 	# Position in world space (must be after add_child for global_position to work)
 	chunk.global_position = Vector3(chunk_pos * Chunk.CHUNK_SIZE)
@@ -215,6 +249,7 @@ func _unload_chunk(chunk_pos: Vector3i) -> void:
 	
 	var chunk: Chunk = chunks[chunk_pos]
 	chunks.erase(chunk_pos)
+	_invalidate_chunk_cache(chunk_pos)
 	chunk.queue_free()
 	
 	emit_signal("chunk_unloaded", chunk_pos)
@@ -242,22 +277,6 @@ func _is_chunk_in_frustum(camera: Camera3D, chunk: Chunk) -> bool:
 	# For now, all loaded chunks are always visible (Godot handles rendering efficiently)
 	return true
 
-# Get the 8 corners of an AABB
-func _get_aabb_corners(aabb: AABB) -> Array[Vector3]:
-	var pos := aabb.position
-	var size := aabb.size
-	
-	return [
-		pos,
-		pos + Vector3(size.x, 0, 0),
-		pos + Vector3(0, size.y, 0),
-		pos + Vector3(0, 0, size.z),
-		pos + Vector3(size.x, size.y, 0),
-		pos + Vector3(size.x, 0, size.z),
-		pos + Vector3(0, size.y, size.z),
-		pos + size
-	]
-
 # ==============================================================================
 # WORLD-LEVEL BLOCK ACCESS
 # ==============================================================================
@@ -266,22 +285,33 @@ func _get_aabb_corners(aabb: AABB) -> Array[Vector3]:
 func get_block_at_world(world_pos: Vector3i) -> Block.Type:
 	var chunk_pos := Chunk.world_to_chunk(world_pos)
 	
-	if not chunks.has(chunk_pos):
+	# Reuse the last chunk if possible, otherwise refresh the cache
+	if chunk_pos != cached_chunk_pos:
+		cached_chunk_pos = chunk_pos
+		cached_chunk = chunks.get(chunk_pos)
+	
+	var chunk := cached_chunk
+	if chunk == null:
 		return Block.Type.AIR
 	
-	var chunk: Chunk = chunks[chunk_pos]
+	# The local position is always inside this chunk, so no bounds check
 	var local_pos := Chunk.world_to_local(world_pos, chunk_pos)
-	
-	return chunk.get_block(local_pos.x, local_pos.y, local_pos.z)
+	return chunk.blocks[local_pos.x][local_pos.y][local_pos.z]
+
+# Drop the cached lookup if it refers to a chunk that was loaded or unloaded
+func _invalidate_chunk_cache(chunk_pos: Vector3i) -> void:
+	if chunk_pos == cached_chunk_pos:
+		cached_chunk_pos = Vector3i.MAX
+		cached_chunk = null
 
 # Set a block at world coordinates
 func set_block_at_world(world_pos: Vector3i, block_type: Block.Type) -> void:
 	var chunk_pos := Chunk.world_to_chunk(world_pos)
 	
-	if not chunks.has(chunk_pos):
+	var chunk: Chunk = chunks.get(chunk_pos)
+	if chunk == null:
 		return
 	
-	var chunk: Chunk = chunks[chunk_pos]
 	var local_pos := Chunk.world_to_local(world_pos, chunk_pos)
 	
 	chunk.set_block(local_pos.x, local_pos.y, local_pos.z, block_type)
@@ -319,27 +349,49 @@ func _rebuild_chunk_at(chunk_pos: Vector3i) -> void:
 
 # Get the block position that a ray hits, plus the face it hit
 func raycast_block(from: Vector3, direction: Vector3, max_distance: float) -> Dictionary:
-	# Use DDA (Digital Differential Analyzer) algorithm for precise voxel raycast
-	var step := 0.1
-	var current := from
-	var prev_block := Vector3i(floor(from.x), floor(from.y), floor(from.z))
-	
-	var distance := 0.0
-	while distance < max_distance:
-		current += direction * step
-		distance += step
+	# Amanatides & Woo fast voxel traversal: visit exactly the cells the ray
+	# passes through, always stepping across the nearest voxel boundary next
+	var dir := direction.normalized()
+	var cell := Chunk.world_to_block(from)
+	var step := Vector3i(dir.sign())
+	
+	# t_max: ray distance to the first boundary on each axis
+	# t_delta: ray distance between successive boundaries on each axis
+	var t_max := Vector3(INF, INF, INF)
+	var t_delta := Vector3(INF, INF, INF)
+	for axis in 3:
+		if step[axis] != 0:
+			var boundary: int = cell[axis] + (1 if step[axis] > 0 else 0)
+			t_max[axis] = (boundary - from[axis]) / dir[axis]
+			t_delta[axis] = absf(1.0 / dir[axis])
+	
+	# A ray starting inside a solid block hits it immediately
+	var start_type := get_block_at_world(cell)
+	if Block.is_solid(start_type):
+		return {
+			"hit": true,
+			"position": cell,
+			"previous": cell,
+			"block_type": start_type
+		}
+	
+	var prev_block := cell
+	while true:
+		var axis := t_max.min_axis_index()
+		if t_max[axis] > max_distance:
+			break
 		
-		var block_pos := Vector3i(floor(current.x), floor(current.y), floor(current.z))
-		var block_type := get_block_at_world(block_pos)
+		prev_block = cell
+		cell[axis] += step[axis]
+		t_max[axis] += t_delta[axis]
 		
+		var block_type := get_block_at_world(cell)
 		if Block.is_solid(block_type):
 			return {
 				"hit": true,
-				"position": block_pos,
+				"position": cell,
 				"previous": prev_block,  # For block placement
 				"block_type": block_type
 			}
-		
-		prev_block = block_pos
 	
 	return {"hit": false}
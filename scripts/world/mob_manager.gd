@@ -50,21 +50,24 @@ func _try_spawn_mob() -> void:
 	
 	# Raycast down to find the ground
 	# We use the chunk manager to check for solid blocks
-	var block_pos := Vector3i(spawn_pos)
+	var block_pos := Chunk.world_to_block(spawn_pos)
 	var found_ground := false
 	
 	# Look down for up to 30 blocks
+	# The previous sample is the block above the current one, so each cell
+	# in the column is queried once
+	var space_above := chunk_manager.get_block_at_world(block_pos + Vector3i(0, 1, 0))
 	for i in range(30):
-		var check_pos = block_pos + Vector3i(0, -i, 0)
-		var block_type = chunk_manager.get_block_at_world(check_pos)
+		var check_pos := block_pos + Vector3i(0, -i, 0)
+		var block_type := chunk_manager.get_block_at_world(check_pos)
 		
-		if block_type != Block.Type.AIR:
-			# Found ground! Check if space above is empty
-			var space_above = chunk_manager.get_block_at_world(check_pos + Vector3i(0, 1, 0))
-			if space_above == Block.Type.AIR:
-				_spawn_mob(Vector3(check_pos) + Vector3(0.5, 1.0, 0.5))
-				found_ground = true
-				break
+		# Found ground with empty space above it
+		if block_type != Block.Type.AIR and space_above == Block.Type.AIR:
+			_spawn_mob(Vector3(check_pos) + Vector3(0.5, 1.0, 0.5))
+			found_ground = true
+			break
+		
+		space_above = block_type
 	
 	if not found_ground:
 		# print("Debug: Failed to find spawn ground")
@@ -101,6 +104,10 @@ func _spawn_mob(pos: Vector3) -> void:
 	# print("Debug: Spawned %s at %s" % [mob.get_class(), pos])
 
 func _update_mobs() -> void:
+	# Player position and squared despawn distance
+	var player_pos := player.global_position
+	var despawn_dist_sq := spawn_radius * 2 * spawn_radius * 2
+	
 	# Cull distant mobs
 	var i := 0
 	while i < mob_list.size():
@@ -109,8 +116,8 @@ func _update_mobs() -> void:
 			mob_list.remove_at(i)
 			continue
 			
-		var dist := player.global_position.distance_to(mob.global_position)
-		if dist > spawn_radius * 2:
+		var dist_sq := player_pos.distance_squared_to(mob.global_position)
+		if dist_sq > despawn_dist_sq:
 			mob.queue_free()
 			mob_list.remove_at(i)
 			# print("Debug: Despawned mob")
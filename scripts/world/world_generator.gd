@@ -60,7 +60,7 @@ func generate_chunk(chunk: Chunk) -> void:
 func _get_terrain_height(world_x: int, world_z: int) -> int:
 	return noise.get_height(float(world_x), float(world_z), min_height, max_height)
 
-# Fill a column of blocks in the chunk
+# Fill a column of blocks in the chunk (blocks above the surface stay AIR)
 func _fill_column(
 	chunk: Chunk, 
 	local_x: int, 
@@ -68,31 +68,21 @@ func _fill_column(
 	terrain_height: int,
 	chunk_world_y: int
 ) -> void:
-	for local_y in Chunk.CHUNK_SIZE:
-		# Calculate world Y coordinate
-		var world_y: int = chunk_world_y + local_y
-		
-		# Determine block type based on height relative to terrain surface
-		var block_type := _get_block_type(world_y, terrain_height)
-		
-		chunk.set_block(local_x, local_y, local_z, block_type)
-
-# Determine block type based on Y position and terrain height
-func _get_block_type(world_y: int, terrain_height: int) -> Block.Type:
-	# Above terrain = air
-	if world_y > terrain_height:
-		return Block.Type.AIR
-	
-	# At terrain surface = grass
-	if world_y == terrain_height:
-		return Block.Type.GRASS
-	
-	# Within dirt layer (1-3 blocks below surface)
-	if world_y > terrain_height - DIRT_DEPTH:
-		return Block.Type.DIRT
+	# Layer ends (exclusive) in local Y, clamped to this chunk
+	# Stone: world_y <= terrain_height - DIRT_DEPTH
+	# Dirt:  up to terrain_height - 1
+	# Grass: world_y == terrain_height
+	var surface_y := terrain_height - chunk_world_y
+	var stone_end := clampi(surface_y - DIRT_DEPTH + 1, 0, Chunk.CHUNK_SIZE)
+	var dirt_end := clampi(surface_y, 0, Chunk.CHUNK_SIZE)
+	var grass_end := clampi(surface_y + 1, 0, Chunk.CHUNK_SIZE)
 	
-	# Below dirt layer = stone
-	return Block.Type.STONE
+	for local_y in range(0, stone_end):
+		chunk.set_block(local_x, local_y, local_z, Block.Type.STONE)
+	for local_y in range(stone_end, dirt_end):
+		chunk.set_block(local_x, local_y, local_z, Block.Type.DIRT)
+	for local_y in range(dirt_end, grass_end):
+		chunk.set_block(local_x, local_y, local_z, Block.Type.GRASS)
 
 # Get spawn height at a world (x, z) position (for player spawning)
 func get_spawn_height(world_x: int, world_z: int) -> int: